@@ -7,9 +7,14 @@ Demonstrates all core capabilities and mission directives.
 """
 
 from caleon_prime import create_caleon
+from collections import Counter
 import json
+import os
 import time
 
+# Seconds to pause between demo steps; set CALEON_DEMO_PACE for a paced run
+DEMO_PACE = float(os.getenv("CALEON_DEMO_PACE", "0"))
+
 def main():
     print("🔥" * 50)
     print("  CALEONPRIME - THE FIRST PROMETHEAN")
@@ -33,7 +38,8 @@ def main():
     for msg in messages:
         echo = caleon.echo(msg)
         print(f"   {echo}")
-        time.sleep(0.5)
+        if DEMO_PACE:
+            time.sleep(DEMO_PACE)
     
     # Test Imprint function
     print("\n3. TESTING MEMORY IMPRINT...")
@@ -46,7 +52,8 @@ def main():
     for data in important_data:
         imprint = caleon.imprint(data)
         print(f"   {imprint}")
-        time.sleep(0.5)
+        if DEMO_PACE:
+            time.sleep(DEMO_PACE)
     
     # Test Protection Protocol
     print("\n4. TESTING FUTURE PROTECTION...")
@@ -78,8 +85,9 @@ def main():
     # Review Memory
     print("\n8. MEMORY REVIEW...")
     total_memories = len(caleon.memory)
-    echo_memories = len(caleon.review_memory("echo"))
-    imprint_memories = len(caleon.review_memory("imprint"))
+    type_counts = Counter(memory.get("type") for memory in caleon.memory)
+    echo_memories = type_counts["echo"]
+    imprint_memories = type_counts["imprint"]
     
     print(f"   Total Memories: {total_memories}")
     print(f"   Echo Memories: {echo_memories}")